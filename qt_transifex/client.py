@@ -40,8 +40,15 @@ class Resource:
         if not r.encoding:
             r.encoding = "utf-8"
 
-        translated_content = r.text
-        output_path.write_text(translated_content)
+        # Write to a temporary file so that an interrupted
+        # download never leaves a partial file
+        tmp_path = output_path.with_name(f"{output_path.name}.part")
+        try:
+            tmp_path.write_text(r.text)
+            tmp_path.replace(output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def update(self, path: Path):
         """Update resource with 'path' content"""
@@ -0,0 +1,73 @@
+"""
+Pull progress journal.
+"""
+
+import hashlib
+
+from pathlib import Path
+from typing import (
+    Optional,
+    Self,
+)
+
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+)
+
+from . import logger
+
+JOURNAL_NAME = ".qt-transifex-pull.json"
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+class PullJournal(BaseModel):
+    resource: str = Field(title="Pulled resource")
+    selected: list[str] = Field(
+        default_factory=list,
+        title="Selected languages",
+        description="Languages requested for the run",
+    )
+    languages: list[str] = Field(
+        default_factory=list,
+        title="Languages",
+        description="Languages to download for the run",
+    )
+    completed: dict[str, str] = Field(
+        default_factory=dict,
+        title="Completed languages",
+        description="Checksums of the downloaded TS files",
+    )
+
+    @classmethod
+    def load(cls, path: Path, resource: str) -> Optional[Self]:
+        """Load the journal for 'resource'"""
+        try:
+            journal = cls.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValidationError:
+            logger.warning("Ignoring invalid pull journal %s", path)
+            return None
+        if journal.resource != resource:
+            logger.warning("Ignoring pull journal %s for resource '%s'", path, journal.resource)
+            return None
+        return journal
+
+    def save(self, path: Path):
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(self.model_dump_json(indent=4))
+        tmp.replace(path)
+
+    def complete(self, lang: str, ts_file: Path):
+        self.completed[lang] = file_digest(ts_file)
+
+    def is_completed(self, lang: str, ts_file: Path) -> bool:
+        """Check that the TS file was completely downloaded"""
+        digest = self.completed.get(lang)
+        return digest is not None and ts_file.exists() and file_digest(ts_file) == digest
@@ -1,6 +1,10 @@
 import sys
 
-from typing import Sequence
+from pathlib import Path
+from typing import (
+    Optional,
+    Sequence,
+)
 
 import click
 
@@ -62,7 +66,8 @@ def make_push(transifex_token: str, dry_run: bool):
 )
 @click.option("--compile", is_flag=True, help="Compile TS files into QM files")
 @click.option("--lang", "-l", multiple=True, help="Selected languages")
-def make_pull(transifex_token: str, compile: bool, lang: Sequence[str]):
+@click.option("--resume", is_flag=True, help="Resume an interrupted pull")
+def make_pull(transifex_token: str, compile: bool, lang: Sequence[str], resume: bool):
     """Pull translation from transifex"""
     from .parameters import load_parameters
 
@@ -72,11 +77,59 @@ def make_pull(transifex_token: str, compile: bool, lang: Sequence[str]):
         lang = parameters.selected_languages
 
     t = Translation(parameters, transifex_token)
-    t.pull(selected_languages=lang)
+    t.pull(selected_languages=lang, resume=resume)
     if compile:
         Translation.compile_strings(parameters)
 
 
+@cli.command("sync")
+@click.option(
+    "--transifex-token",
+    help="Transifex API token",
+    envvar="TRANSIFEX_TOKEN",
+    required=True,
+)
+@click.option("--lang", "-l", multiple=True, help="Selected languages")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(1),
+    default=4,
+    show_default=True,
+    help="Number of concurrent jobs (at least two workers are always used)",
+)
+@click.option("--dry-run", is_flag=True, help="Dry run")
+def make_sync(transifex_token: str, lang: Sequence[str], jobs: int, dry_run: bool):
+    """Update, push, pull and compile translations"""
+    from .parameters import load_parameters
+    from .sync import sync
+
+    parameters = load_parameters()
+
+    if not lang:
+        lang = parameters.selected_languages
+
+    if dry_run:
+        click.echo(click.style("Not pushing to transifex because it is a dry-run", fg="yellow"))
+
+    summary = sync(
+        parameters,
+        transifex_token,
+        selected_languages=lang,
+        dry_run=dry_run,
+        jobs=jobs,
+    )
+
+    click.echo(f"Pushed: {'yes' if summary.pushed else 'no'}")
+    click.echo(f"Languages: {' '.join(summary.languages) or '-'}")
+    for label, files in (("created", summary.created), ("updated", summary.updated)):
+        for path in files:
+            click.echo(f"{label:>9} {path.name}")
+    click.echo(
+        f"{len(summary.created)} created, {len(summary.updated)} updated, {len(summary.unchanged)} unchanged",
+    )
+
+
 @cli.command("compile")
 def make_compile():
     """Compile ts files"""
@@ -132,6 +185,84 @@ def list_languages(transifex_token: str, json_format: bool):
             click.echo(f"{i + 1:>3}. {lang.code:<10} {lang.name:<25} {stat[0]:<8} {stat[1]:.2f}")
 
 
+#
+# Translation memory
+#
+@cli.group("tm")
+@click.option(
+    "--db",
+    "db_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar="QT_TRANSIFEX_TM",
+    help="Translation memory database",
+)
+@click.pass_context
+def tm(ctx: click.Context, db_path: Optional[Path]):
+    """Manage the local translation memory"""
+    from .tm import default_db_path
+
+    ctx.obj = db_path or default_db_path()
+
+
+@tm.command("index")
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.option("--force", is_flag=True, help="Reindex unchanged files")
+@click.pass_obj
+def tm_index(db_path: Path, paths: Sequence[Path], force: bool):
+    """Index TS files into the translation memory
+
+    PATHS may be TS files or directories to search for TS files.
+    Default to the project's i18n directory.
+    """
+    from .tm import TranslationMemory
+
+    resource = None
+    if not paths:
+        from .parameters import load_parameters
+
+        parameters = load_parameters()
+        resource = parameters.resource
+        paths = (parameters.plugin_path.joinpath("i18n"),)
+
+    files = (f for p in paths for f in (sorted(p.glob("**/*.ts")) if p.is_dir() else (p,)))
+    with TranslationMemory(db_path) as mem:
+        count = mem.index(files, resource=resource, force=force)
+    click.echo(f"Indexed {count} file(s) into {db_path}")
+
+
+@tm.command("fill")
+@click.option("--lang", "-l", multiple=True, help="Selected languages")
+@click.option("--exact", is_flag=True, help="Use only exact matches")
+@click.option("--dry-run", is_flag=True, help="Dry run")
+@click.pass_obj
+def tm_fill(db_path: Path, lang: Sequence[str], exact: bool, dry_run: bool):
+    """Fill untranslated strings from the translation memory"""
+    from .parameters import load_parameters
+    from .tm import TranslationMemory
+
+    parameters = load_parameters()
+    source_ts = Translation.translation_file_path(parameters)
+
+    if not db_path.exists():
+        raise TranslationError(f"Translation memory {db_path} does not exists")
+
+    with TranslationMemory(db_path) as mem:
+        for ts_file in sorted(source_ts.parent.glob(f"{parameters.resource}_*.ts")):
+            if ts_file == source_ts:
+                continue
+            if lang and ts_file.stem.removeprefix(f"{parameters.resource}_") not in lang:
+                continue
+            try:
+                rv = mem.fill(ts_file, parameters.resource, exact_only=exact, dry_run=dry_run)
+            except TranslationError as err:
+                logger.warning("%s", err)
+                continue
+            click.echo(
+                f"{ts_file.name:<30} "
+                f"exact: {rv.exact:<6} normalized: {rv.normalized:<6} missing: {rv.missing}",
+            )
+
+
 def main():
     try:
         cli()
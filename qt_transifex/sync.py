@@ -0,0 +1,101 @@
+"""
+Run extract, push, pull and compile as a single pipeline.
+"""
+
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Sequence
+
+from .journal import file_digest
+from .parameters import Parameters
+from .translation import Translation
+
+
+def _digests(i18n_path: Path) -> dict[Path, str]:
+    return {p: file_digest(p) for p in i18n_path.glob("*") if p.suffix in (".ts", ".qm")}
+
+
+@dataclass
+class SyncSummary:
+    pushed: bool = False
+    languages: Sequence[str] = ()
+    created: list[Path] = field(default_factory=list)
+    updated: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+
+
+def sync(
+    parameters: Parameters,
+    tx_api_token: str,
+    *,
+    selected_languages: Sequence[str] = (),
+    dry_run: bool = False,
+    jobs: int = 4,
+) -> SyncSummary:
+    """Extract, push, pull and compile translations
+
+    Stages run concurrently as soon as their dependencies are met:
+
+    * Source strings extraction overlaps with the project resolution;
+    * The upload overlaps with languages and statistics fetches;
+    * Each language is compiled as soon as its download is completed.
+
+    At least two workers are used, since the project resolution and
+    the source extraction always run concurrently.
+    """
+    summary = SyncSummary()
+
+    i18n_path = parameters.plugin_path.joinpath("i18n")
+    before = _digests(i18n_path)
+
+    with ThreadPoolExecutor(max_workers=max(jobs, 2)) as executor:
+        try:
+            connect = executor.submit(Translation, parameters, tx_api_token, create_project=True)
+            extract = executor.submit(Translation.update_strings, parameters)
+
+            t = connect.result()
+            fetch_languages = executor.submit(t.languages, selected_languages)
+
+            extract.result()
+            compiles = [
+                executor.submit(
+                    Translation.compile_files,
+                    parameters,
+                    Translation.translation_file_path(parameters),
+                ),
+            ]
+
+            if not dry_run:
+                resource = t.push()
+                summary.pushed = True
+            else:
+                resource = t.resource()
+
+            summary.languages = sorted(fetch_languages.result())
+            downloads: list[Future[Path]] = [
+                executor.submit(t.download, resource, lang) for lang in summary.languages
+            ]
+            for fut in as_completed(downloads):
+                compiles.append(executor.submit(Translation.compile_files, parameters, fut.result()))
+
+            for fut in compiles:
+                fut.result()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    for path, digest in sorted(_digests(i18n_path).items()):
+        match before.get(path):
+            case None:
+                summary.created.append(path)
+            case d if d != digest:
+                summary.updated.append(path)
+            case _:
+                summary.unchanged.append(path)
+
+    return summary
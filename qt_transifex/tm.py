@@ -0,0 +1,297 @@
+"""
+Local translation memory.
+
+Index translated TS files into a SQLite database keyed by
+language, context and source text, and use it to pre-fill
+untranslated messages.
+"""
+
+import os
+import re
+import sqlite3
+import xml.etree.ElementTree as ET  # nosec B405
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Iterable,
+    Iterator,
+    Optional,
+    Self,
+)
+
+from . import logger
+from .errors import TranslationError
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    origin TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    context TEXT NOT NULL,
+    source TEXT NOT NULL,
+    norm TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    PRIMARY KEY (origin, lang, context, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS units_source ON units (lang, source, context);
+CREATE INDEX IF NOT EXISTS units_norm ON units (lang, norm);
+"""
+
+TS_HEADER = '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE TS>\n'
+
+_WS_RE = re.compile(r"\s+")
+_ACCEL_RE = re.compile(r"&(?!&)")
+# Language suffix of TS file names, i.e `plugin_fr.ts`, `plugin_pt_BR.ts`
+_LANG_RE = re.compile(r"_([a-z]{2,3}(?:_[A-Z]{2}|_[A-Z][a-z]{3})?)$")
+
+
+def default_db_path() -> Path:
+    """Return the default translation memory location"""
+    cache = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache) if cache else Path.home().joinpath(".cache")
+    return base.joinpath("qt-transifex", "tm.sqlite")
+
+
+def normalize(text: str) -> str:
+    """Normalize source text for fuzzy matching
+
+    Collapse whitespaces, remove keyboard accelerators and
+    ignore case.
+    """
+    text = _ACCEL_RE.sub("", text).replace("&&", "&")
+    return _WS_RE.sub(" ", text).strip().casefold()
+
+
+@dataclass(frozen=True)
+class Unit:
+    lang: str
+    context: str
+    source: str
+    translation: str
+
+
+def ts_language(root: ET.Element, path: Path, resource: Optional[str] = None) -> str:
+    """Return the language of a TS document
+
+    Fallback to the `<resource>_<lang>.ts` file name
+    convention if the language attribute is not set
+    (as written by pylupdate5).
+    """
+    lang = root.get("language")
+    if lang:
+        return lang
+    if resource and path.stem.startswith(f"{resource}_"):
+        return path.stem.removeprefix(f"{resource}_")
+    m = _LANG_RE.search(path.stem)
+    if not m:
+        raise TranslationError(f"Cannot determine the language of {path}")
+    return m.group(1)
+
+
+def _is_finished(translation: ET.Element) -> bool:
+    return translation.get("type") not in ("unfinished", "obsolete", "vanished")
+
+
+def read_units(path: Path, resource: Optional[str] = None) -> Iterator[Unit]:
+    """Read finished translations from a TS file
+
+    Plural (numerus) messages are ignored.
+    """
+    try:
+        root = ET.parse(path).getroot()  # nosec B314
+    except ET.ParseError as err:
+        raise TranslationError(f"Invalid TS file {path}: {err}") from None
+
+    lang = ts_language(root, path, resource)
+    for context in root.iter("context"):
+        name = context.findtext("name") or ""
+        for message in context.iter("message"):
+            if message.get("numerus") == "yes":
+                continue
+            source = message.findtext("source")
+            translation = message.find("translation")
+            if not source or translation is None or not translation.text:
+                continue
+            if _is_finished(translation):
+                yield Unit(lang, name, source, translation.text)
+
+
+@dataclass
+class FillResult:
+    exact: int = 0
+    normalized: int = 0
+    missing: int = 0
+
+
+class TranslationMemory:
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def index(
+        self,
+        paths: Iterable[Path],
+        resource: Optional[str] = None,
+        force: bool = False,
+    ) -> int:
+        """Index TS files into the translation memory
+
+        Files that did not change since the last indexation are
+        skipped unless `force` is set. Invalid files are skipped
+        with a warning. Entries of indexed files that no longer
+        exist are removed.
+        Return the number of indexed files.
+        """
+        count = 0
+        with self._conn:
+            self.prune()
+            for path in paths:
+                path = path.resolve()
+                st = path.stat()
+                origin = str(path)
+                if not force:
+                    row = self._conn.execute(
+                        "SELECT mtime_ns, size FROM files WHERE path = ?",
+                        (origin,),
+                    ).fetchone()
+                    if row == (st.st_mtime_ns, st.st_size):
+                        logger.debug("Skipping unchanged file %s", path)
+                        continue
+
+                logger.info("Indexing %s", path)
+                try:
+                    units = list(read_units(path, resource))
+                except TranslationError as err:
+                    logger.warning("%s", err)
+                    continue
+
+                self._conn.execute("DELETE FROM units WHERE origin = ?", (origin,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO units VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (origin, u.lang, u.context, u.source, normalize(u.source), u.translation)
+                        for u in units
+                    ),
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                    (origin, st.st_mtime_ns, st.st_size),
+                )
+                count += 1
+        return count
+
+    def prune(self) -> int:
+        """Remove entries of indexed files that no longer exist
+
+        Return the number of removed files.
+        """
+        removed = [
+            (origin,)
+            for (origin,) in self._conn.execute("SELECT path FROM files").fetchall()
+            if not Path(origin).exists()
+        ]
+        if removed:
+            logger.info("Removing %s deleted file(s) from translation memory", len(removed))
+            self._conn.executemany("DELETE FROM units WHERE origin = ?", removed)
+            self._conn.executemany("DELETE FROM files WHERE path = ?", removed)
+        return len(removed)
+
+    def lookup(self, lang: str, context: str, source: str) -> Optional[str]:
+        """Return the exact match for a source text
+
+        A match in the same context is preferred, otherwise
+        the most frequent translation of the source text is
+        returned.
+        """
+        row = self._conn.execute(
+            "SELECT translation FROM units WHERE lang = ? AND source = ? AND context = ? LIMIT 1",
+            (lang, source, context),
+        ).fetchone()
+        if row:
+            return row[0]
+        row = self._conn.execute(
+            "SELECT translation FROM units WHERE lang = ? AND source = ? "
+            "GROUP BY translation ORDER BY COUNT(*) DESC LIMIT 1",
+            (lang, source),
+        ).fetchone()
+        return row[0] if row else None
+
+    def lookup_normalized(self, lang: str, source: str) -> Optional[str]:
+        """Return the most frequent translation matching the normalized source text"""
+        row = self._conn.execute(
+            "SELECT translation FROM units WHERE lang = ? AND norm = ? "
+            "GROUP BY translation ORDER BY COUNT(*) DESC LIMIT 1",
+            (lang, normalize(source)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def fill(
+        self,
+        path: Path,
+        resource: Optional[str] = None,
+        exact_only: bool = False,
+        dry_run: bool = False,
+    ) -> FillResult:
+        """Fill untranslated messages of a TS file
+
+        Exact matches are marked as finished, normalized matches
+        are left 'unfinished' so that they get reviewed.
+        """
+        try:
+            root = ET.parse(path).getroot()  # nosec B314
+        except ET.ParseError as err:
+            raise TranslationError(f"Invalid TS file {path}: {err}") from None
+        lang = ts_language(root, path, resource)
+
+        result = FillResult()
+        for context in root.iter("context"):
+            name = context.findtext("name") or ""
+            for message in context.iter("message"):
+                if message.get("numerus") == "yes":
+                    continue
+                source = message.findtext("source")
+                translation = message.find("translation")
+                if not source or translation is None:
+                    continue
+                if translation.get("type") != "unfinished" or translation.text:
+                    continue
+
+                text = self.lookup(lang, name, source)
+                if text is not None:
+                    translation.text = text
+                    del translation.attrib["type"]
+                    result.exact += 1
+                    continue
+
+                if not exact_only:
+                    text = self.lookup_normalized(lang, source)
+                    if text is not None:
+                        translation.text = text
+                        result.normalized += 1
+                        continue
+
+                result.missing += 1
+
+        if not dry_run and (result.exact or result.normalized):
+            logger.info("Writing %s", path)
+            path.write_text(TS_HEADER + ET.tostring(root, encoding="unicode") + "\n", encoding="utf-8")
+
+        return result
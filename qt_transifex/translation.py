@@ -12,8 +12,9 @@ from pathlib import Path
 from typing import Sequence
 
 from . import logger
-from .client import Client
+from .client import Client, Resource
 from .errors import TranslationError
+from .journal import JOURNAL_NAME, PullJournal
 from .parameters import Parameters
 
 
@@ -60,16 +61,22 @@ class Translation:
 
         self._project = project
 
-    def pull(self, selected_languages: Sequence[str] = ()):
-        """
-        Pull TS files from Transifex
-        """
+    @property
+    def i18n_path(self) -> Path:
+        return self._plugin_path.joinpath("i18n")
+
+    def resource(self) -> Resource:
         resource = self._project.resource(self._ts_name)
         if not resource:
             raise TranslationError(f"Resource {self._ts_name} does not exists")
+        return resource
 
+    def languages(self, selected_languages: Sequence[str] = ()) -> set[str]:
+        """
+        Return the languages to pull from Transifex
+        """
         languages = {lang.code for lang in self._project.languages()}
-        logger.info("%s languages found for '%s'", len(languages), resource)
+        logger.info("%s languages found for '%s'", len(languages), self._ts_name)
 
         if selected_languages:
             languages.intersection_update(selected_languages)
@@ -80,16 +87,70 @@ class Translation:
             candidates = {code for code, ratio in stats if code in languages and ratio >= self._minimum_tr}
             languages = candidates
 
+        return languages
+
+    def ts_file_path(self, lang: str) -> Path:
+        return self.i18n_path.joinpath(f"{self._ts_name}_{lang}.ts")
+
+    def download(self, resource: Resource, lang: str) -> Path:
+        """
+        Download the TS file for language 'lang'
+        """
+        ts_file = self.ts_file_path(lang)
+        logger.info(f"Downloading translation file: {ts_file}")
+        resource.download(lang, ts_file)
+        return ts_file
+
+    def pull(self, selected_languages: Sequence[str] = (), resume: bool = False):
+        """
+        Pull TS files from Transifex
+
+        Completed languages are recorded in a journal; if 'resume'
+        is set, languages from a previous interrupted run are
+        verified against the journal instead of being downloaded again.
+        A new pull is started if the selected languages differ from
+        the interrupted run.
+        """
+        resource = self.resource()
+
         # Ensure that the directory exists
-        i18n_dir = self._plugin_path.joinpath("i18n")
-        i18n_dir.mkdir(parents=True, exist_ok=True)
+        self.i18n_path.mkdir(parents=True, exist_ok=True)
+
+        selected = sorted(selected_languages)
+
+        journal_path = self.i18n_path.joinpath(JOURNAL_NAME)
+        journal = PullJournal.load(journal_path, self._ts_name) if resume else None
+        if journal and journal.selected != selected:
+            logger.warning(
+                "Selected languages differ from the interrupted pull (%s), starting a new pull",
+                ", ".join(journal.selected) or "all",
+            )
+            journal = None
+        if journal:
+            logger.info(
+                "Resuming pull: %s/%s languages completed",
+                len(journal.completed),
+                len(journal.languages),
+            )
+        else:
+            journal = PullJournal(
+                resource=self._ts_name,
+                selected=selected,
+                languages=sorted(self.languages(selected_languages)),
+            )
+            journal.save(journal_path)
+
+        for lang in journal.languages:
+            if journal.is_completed(lang, self.ts_file_path(lang)):
+                logger.info("Translation file for '%s' already downloaded", lang)
+                continue
+            ts_file = self.download(resource, lang)
+            journal.complete(lang, ts_file)
+            journal.save(journal_path)
 
-        for lang in sorted(languages):
-            ts_file = i18n_dir.joinpath(f"{self._ts_name}_{lang}.ts")
-            logger.info(f"Downloading translation file: {ts_file}")
-            resource.download(lang, ts_file)
+        journal_path.unlink()
 
-    def push(self):
+    def push(self) -> Resource:
         logger.info(f"Pushing resource: {self._ts_name} from '{self._ts_path}'")
 
         if not self._ts_path.exists():
@@ -99,14 +160,25 @@ class Translation:
         if not resource:
             resource = self._project.create_resource(self._ts_name)
         resource.update(self._ts_path)
+        return resource
+
+    @classmethod
+    def source_files(cls, parameters: Parameters) -> tuple[Sequence[Path], Sequence[Path]]:
+        """Return python and ui source files"""
+        sources_py: list[Path] = []
+        sources_ui: list[Path] = []
+        for p in parameters.plugin_path.rglob("*"):
+            match p.suffix:
+                case ".py":
+                    sources_py.append(p)
+                case ".ui":
+                    sources_ui.append(p)
+        return sources_py, sources_ui
 
     @classmethod
     def update_strings(cls, parameters: Parameters):
         """Update TS files from QT resource strings"""
-        plugin_path = parameters.plugin_path
-
-        sources_py = plugin_path.glob("**/*.py")
-        sources_ui = plugin_path.glob("**/*.ui")
+        sources_py, sources_ui = cls.source_files(parameters)
 
         project_file = parameters.plugin_path.joinpath(f"{parameters.project}.pro")
 
@@ -148,13 +220,20 @@ class Translation:
         """
         Compile TS file into QM files
         """
-        ts_files = tuple(str(p) for p in parameters.plugin_path.glob("i18n/*.ts"))
+        ts_files = tuple(parameters.plugin_path.glob("i18n/*.ts"))
         if not ts_files:
             raise TranslationError(f"No TS files found in {parameters.plugin_path.joinpath('i18n')}")
 
+        cls.compile_files(parameters, *ts_files)
+
+    @classmethod
+    def compile_files(cls, parameters: Parameters, *ts_files: Path):
+        """
+        Compile the given TS files into QM files
+        """
         cmd = [
             str(parameters.lrelease_executable),
-            *ts_files,
+            *(str(p) for p in ts_files),
         ]
 
         logger.debug("Running command %s", cmd)
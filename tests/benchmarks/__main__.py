@@ -0,0 +1,7 @@
+"""
+Usage: python -m tests.benchmarks [OPTIONS]
+"""
+
+from .bench import bench
+
+bench()
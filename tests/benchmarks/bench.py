@@ -0,0 +1,163 @@
+"""
+Benchmark local pipeline stages.
+"""
+
+import json
+import platform
+import sys
+import tempfile
+import time
+
+from contextlib import chdir
+from pathlib import Path
+from typing import (
+    Callable,
+    Optional,
+)
+
+import click
+
+from qt_transifex.parameters import Parameters, load_parameters
+from qt_transifex.translation import Translation
+
+from .generate import LANGUAGES, generate_plugin
+
+SIZES = {
+    "small": {"py_files": 100, "ui_files": 20, "languages": 5},
+    "medium": {"py_files": 1000, "ui_files": 200, "languages": 20},
+    "large": {"py_files": 5000, "ui_files": 1000, "languages": len(LANGUAGES)},
+}
+
+
+def timeit(
+    func: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], object]] = None,
+) -> float:
+    """Return the best time of `repeat` runs
+
+    `setup` is run before each run and is not timed.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_stages(rootdir: Path, repeat: int) -> dict[str, float]:
+    results = {}
+
+    results["load_parameters"] = timeit(lambda: load_parameters(rootdir), repeat)
+
+    parameters: Parameters = load_parameters(rootdir)
+    results["source_files"] = timeit(lambda: Translation.source_files(parameters), repeat)
+    # Measure a fresh extraction: pylupdate5 merges into an existing TS file
+    ts_path = Translation.translation_file_path(parameters)
+    results["update_strings"] = timeit(
+        lambda: Translation.update_strings(parameters),
+        repeat,
+        setup=lambda: ts_path.unlink(missing_ok=True),
+    )
+    results["compile_strings"] = timeit(lambda: Translation.compile_strings(parameters), repeat)
+
+    return results
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    tolerance: float,
+) -> list[str]:
+    """Return the stages slower than the baseline by more than `tolerance`"""
+    regressions = []
+    for stage, value in results.items():
+        ref = baseline.get(stage)
+        if ref is not None and value > ref * (1.0 + tolerance):
+            regressions.append(f"{stage}: {value:.4f}s > {ref:.4f}s (+{100.0 * (value / ref - 1.0):.0f}%)")
+    return regressions
+
+
+@click.command()
+@click.option("--size", type=click.Choice(tuple(SIZES)), default="medium", help="Generated tree size")
+@click.option("--repeat", default=3, show_default=True, help="Number of runs for each stage")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write results as json",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Baseline results to compare with",
+)
+@click.option("--tolerance", default=0.2, show_default=True, help="Allowed slowdown ratio")
+@click.option("--update-baseline", is_flag=True, help="Store results as the new baseline")
+@click.option(
+    "--workdir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Keep the generated tree in this directory",
+)
+def bench(
+    size: str,
+    repeat: int,
+    output: Optional[Path],
+    baseline: Optional[Path],
+    tolerance: float,
+    update_baseline: bool,
+    workdir: Optional[Path],
+):
+    """Benchmark local pipeline stages on a synthetic plugin tree"""
+    if update_baseline and not baseline:
+        raise click.UsageError("--update-baseline requires --baseline")
+
+    ref = None
+    if baseline and not update_baseline:
+        if not baseline.exists():
+            raise click.UsageError(f"Baseline {baseline} not found, use --update-baseline")
+        try:
+            ref = json.loads(baseline.read_text())
+        except json.JSONDecodeError as err:
+            raise click.UsageError(f"Invalid baseline {baseline}: {err}") from None
+        if not isinstance(ref, dict) or "stages" not in ref:
+            raise click.UsageError(f"Invalid baseline {baseline}: no 'stages' found, use --update-baseline")
+        if ref.get("size") != size:
+            raise click.UsageError(f"Baseline size '{ref.get('size')}' does not match '{size}'")
+
+    opts = SIZES[size]
+
+    with tempfile.TemporaryDirectory(prefix="qt-transifex-bench-") as tmpdir:
+        rootdir = workdir or Path(tmpdir)
+        generate_plugin(
+            rootdir,
+            py_files=opts["py_files"],
+            ui_files=opts["ui_files"],
+            languages=LANGUAGES[: opts["languages"]],
+        )
+        with chdir(rootdir):
+            stages = run_stages(rootdir, repeat)
+
+    results = {
+        "size": size,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "stages": stages,
+    }
+
+    for stage, value in stages.items():
+        click.echo(f"{stage:<20} {value:.4f}s")
+
+    if output:
+        output.write_text(json.dumps(results, indent=4))
+
+    if baseline and update_baseline:
+        baseline.write_text(json.dumps(results, indent=4))
+    elif ref:
+        regressions = compare(stages, ref["stages"], tolerance)
+        for msg in regressions:
+            click.echo(click.style(f"REGRESSION: {msg}", fg="red"), err=True)
+        if regressions:
+            sys.exit(1)
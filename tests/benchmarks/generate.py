@@ -0,0 +1,109 @@
+"""
+Generate synthetic plugin trees for benchmarks.
+"""
+
+from pathlib import Path
+from typing import Sequence
+
+LANGUAGES = (
+    "ar", "bg", "ca", "cs", "da", "de", "el", "es", "et", "eu",
+    "fa", "fi", "fr", "gl", "he", "hr", "hu", "id", "it", "ja",
+    "ko", "lt", "lv", "nb", "nl", "pl", "pt", "pt_BR", "ro", "ru",
+    "sk", "sl", "sr", "sv", "th", "tr", "uk", "vi", "zh_CN", "zh_TW",
+)  # fmt: skip
+
+CONFIG = """[tool.qt-transifex]
+plugin_source = "{plugin}"
+organization = "benchmark"
+project = "{plugin}"
+repository_url = "https://example.com/{plugin}"
+"""
+
+PY_TEMPLATE = """from qgis.PyQt.QtCore import QObject
+
+
+class Module{index}(QObject):
+    def messages(self):
+        return (
+{calls}
+        )
+"""
+
+UI_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Form{index}</class>
+ <widget class="QWidget" name="Form{index}">
+{widgets}
+ </widget>
+</ui>
+"""
+
+UI_WIDGET = """  <widget class="QLabel" name="label_{n}">
+   <property name="text">
+    <string>{text}</string>
+   </property>
+  </widget>"""
+
+TS_MESSAGE = """    <message>
+        <source>{source}</source>
+        <translation>{translation}</translation>
+    </message>"""
+
+
+def source_string(index: int, n: int) -> str:
+    # Some strings are shared between modules
+    return f"Message {n}" if n % 2 else f"Module {index} message {n}"
+
+
+def generate_plugin(
+    rootdir: Path,
+    *,
+    plugin: str = "benchmark_plugin",
+    py_files: int = 1000,
+    ui_files: int = 200,
+    strings: int = 10,
+    languages: Sequence[str] = LANGUAGES,
+) -> Path:
+    """Generate a plugin tree with translatable strings
+
+    Sources are spread over nested packages; a TS file with
+    finished translations is generated for each language.
+    Return the root directory.
+    """
+    rootdir.mkdir(parents=True, exist_ok=True)
+    rootdir.joinpath("pyproject.toml").write_text(CONFIG.format(plugin=plugin))
+
+    plugin_path = rootdir.joinpath(plugin)
+    plugin_path.mkdir(exist_ok=True)
+    plugin_path.joinpath("__init__.py").touch()
+
+    for i in range(py_files):
+        package = plugin_path.joinpath(f"pkg{i // 50:03}")
+        if not package.exists():
+            package.mkdir()
+            package.joinpath("__init__.py").touch()
+        calls = "\n".join(f'            self.tr("{source_string(i, n)}"),' for n in range(strings))
+        package.joinpath(f"module{i:05}.py").write_text(PY_TEMPLATE.format(index=i, calls=calls))
+
+    ui_path = plugin_path.joinpath("ui")
+    ui_path.mkdir(exist_ok=True)
+    for i in range(ui_files):
+        widgets = "\n".join(UI_WIDGET.format(n=n, text=source_string(i, n)) for n in range(strings))
+        ui_path.joinpath(f"form{i:05}.ui").write_text(UI_TEMPLATE.format(index=i, widgets=widgets))
+
+    i18n_path = plugin_path.joinpath("i18n")
+    i18n_path.mkdir(exist_ok=True)
+    for lang in languages:
+        contexts = []
+        for i in range(py_files):
+            messages = "\n".join(
+                TS_MESSAGE.format(source=(s := source_string(i, n)), translation=f"[{lang}] {s}")
+                for n in range(strings)
+            )
+            contexts.append(f"<context>\n    <name>Module{i}</name>\n{messages}\n</context>")
+        i18n_path.joinpath(f"{plugin}_{lang}.ts").write_text(
+            '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE TS>\n'
+            f'<TS version="2.1" language="{lang}">\n' + "\n".join(contexts) + "\n</TS>\n",
+        )
+
+    return rootdir
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from qt_transifex.parameters import load_parameters
+from qt_transifex.translation import Translation
+
+from .benchmarks.bench import compare
+from .benchmarks.generate import generate_plugin
+
+
+def test_generate_plugin(tmp_path: Path):
+    generate_plugin(tmp_path, py_files=60, ui_files=5, strings=3, languages=("fr", "de"))
+
+    parameters = load_parameters(tmp_path)
+    sources_py, sources_ui = Translation.source_files(parameters)
+    # Modules and packages `__init__.py`
+    assert len(sources_py) == 60 + 2 + 1
+    assert len(sources_ui) == 5
+    assert len(list(parameters.plugin_path.glob("i18n/*.ts"))) == 2
+
+
+def test_compare():
+    baseline = {"update_strings": 1.0, "compile_strings": 2.0}
+    results = {"update_strings": 1.1, "compile_strings": 3.0, "source_files": 0.5}
+
+    regressions = compare(results, baseline, tolerance=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("compile_strings")
@@ -33,3 +33,14 @@ def test_cli_pull(fixtures: Path):
         print("\n::test_cli_pull::", result.output)
 
         assert result.exit_code == 0
+
+
+@pytest.mark.skipif(not os.getenv("TRANSIFEX_TOKEN"), reason="No transifex token defined")
+def test_cli_sync(fixtures: Path):
+    with chdir(fixtures):
+        runner = CliRunner()
+        result = runner.invoke(cli, ["-vv", "sync", "--dry-run"])
+
+        print("\n::test_cli_sync::", result.output)
+
+        assert result.exit_code == 0
@@ -0,0 +1,123 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from qt_transifex import client
+from qt_transifex.errors import TranslationError
+from qt_transifex.journal import JOURNAL_NAME, PullJournal
+from qt_transifex.translation import Translation
+
+
+class Interrupted(Exception):
+    pass
+
+
+class FakeResource:
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.downloaded: list[str] = []
+
+    def download(self, lang: str, output_path: Path):
+        if lang == self.fail_on:
+            raise Interrupted(lang)
+        self.downloaded.append(lang)
+        output_path.write_text(f"<TS language='{lang}'/>")
+
+
+class FakeProject:
+    def __init__(self, resource: FakeResource | None):
+        self._resource = resource
+
+    def resource(self, name: str) -> FakeResource | None:
+        return self._resource
+
+    def languages(self) -> list[SimpleNamespace]:
+        return [SimpleNamespace(code=code) for code in ("de", "es", "fr", "it")]
+
+
+def translation(plugin_path: Path, resource: FakeResource | None) -> Translation:
+    t = Translation.__new__(Translation)
+    t._plugin_path = plugin_path
+    t._ts_name = "plugin"
+    t._minimum_tr = None
+    t._project = FakeProject(resource)  # type: ignore [assignment]
+    return t
+
+
+def test_pull_resume(tmp_path: Path):
+    journal_path = tmp_path.joinpath("i18n", JOURNAL_NAME)
+
+    with pytest.raises(Interrupted):
+        translation(tmp_path, FakeResource(fail_on="fr")).pull()
+
+    journal = PullJournal.load(journal_path, "plugin")
+    assert journal is not None
+    assert journal.languages == ["de", "es", "fr", "it"]
+    assert sorted(journal.completed) == ["de", "es"]
+
+    # Alter a completed file
+    tmp_path.joinpath("i18n", "plugin_es.ts").write_text("partial")
+
+    resource = FakeResource()
+    translation(tmp_path, resource).pull(resume=True)
+    assert resource.downloaded == ["es", "fr", "it"]
+    assert not journal_path.exists()
+
+
+def test_pull_missing_resource(tmp_path: Path):
+    with pytest.raises(TranslationError):
+        translation(tmp_path, None).pull()
+
+    assert not tmp_path.joinpath("i18n").exists()
+
+
+def test_pull_journal_resource(tmp_path: Path):
+    path = tmp_path.joinpath(JOURNAL_NAME)
+    PullJournal(resource="plugin", languages=["fr"]).save(path)
+
+    assert PullJournal.load(path, "plugin") is not None
+    assert PullJournal.load(path, "other") is None
+
+    path.write_text("{")
+    assert PullJournal.load(path, "plugin") is None
+
+
+def test_pull_resume_selection(tmp_path: Path):
+    with pytest.raises(Interrupted):
+        translation(tmp_path, FakeResource(fail_on="fr")).pull()
+
+    # Selection differs from the interrupted run: start a new pull
+    resource = FakeResource()
+    translation(tmp_path, resource).pull(selected_languages=("fr",), resume=True)
+    assert resource.downloaded == ["fr"]
+
+
+def test_resource_download(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(client.tx_api.Language, "get", lambda code: code)
+    monkeypatch.setattr(
+        client.tx_api.ResourceTranslationsAsyncDownload,
+        "download",
+        lambda resource, language: f"https://example.com/{language}",
+    )
+    monkeypatch.setattr(
+        client.requests,
+        "get",
+        lambda url: SimpleNamespace(encoding=None, text=f"<TS language='{url[-2:]}'/>"),
+    )
+
+    output_path = tmp_path.joinpath("plugin_fr.ts")
+    resource = client.Resource(None)  # type: ignore [arg-type]
+    resource.download("fr", output_path)
+    assert output_path.read_text() == "<TS language='fr'/>"
+
+    # Interrupted write leaves the previous file and no partial file
+    def replace(self, target):
+        raise Interrupted()
+
+    monkeypatch.setattr(Path, "replace", replace)
+    with pytest.raises(Interrupted):
+        resource.download("de", output_path)
+
+    assert output_path.read_text() == "<TS language='fr'/>"
+    assert list(tmp_path.iterdir()) == [output_path]
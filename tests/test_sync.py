@@ -0,0 +1,57 @@
+import shutil
+
+from contextlib import chdir
+from pathlib import Path
+
+import pytest
+
+from qt_transifex import sync as sync_mod
+from qt_transifex.parameters import load_parameters
+from qt_transifex.translation import Translation
+
+
+class FakeTranslation:
+    """Replace Transifex calls by copying the source TS file"""
+
+    def __init__(self, parameters, tx_api_token, create_project=False):
+        self._parameters = parameters
+        self.i18n_path = parameters.plugin_path.joinpath("i18n")
+
+    def languages(self, selected_languages=()):
+        return set(selected_languages or ("fr", "de"))
+
+    def resource(self):
+        return None
+
+    def push(self):
+        return None
+
+    def download(self, resource, lang):
+        ts_file = self.i18n_path.joinpath(f"{self._parameters.resource}_{lang}.ts")
+        source = Translation.translation_file_path(self._parameters).read_text()
+        ts_file.write_text(source.replace('language="en', f'language="{lang}'))
+        return ts_file
+
+    update_strings = Translation.update_strings
+    compile_files = Translation.compile_files
+    translation_file_path = Translation.translation_file_path
+
+
+def test_sync(fixtures: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    rootdir = shutil.copytree(fixtures, tmp_path.joinpath("fixtures"))
+    parameters = load_parameters(rootdir)
+    i18n_path = parameters.plugin_path.joinpath("i18n")
+    shutil.rmtree(i18n_path, ignore_errors=True)
+
+    monkeypatch.setattr(sync_mod, "Translation", FakeTranslation)
+
+    with chdir(rootdir):
+        summary = sync_mod.sync(parameters, "token", selected_languages=("fr", "de"))
+        assert summary.pushed
+        assert summary.languages == ["de", "fr"]
+        assert len(summary.created) == 6
+        assert i18n_path.joinpath(f"{parameters.resource}_fr.qm").exists()
+
+        summary = sync_mod.sync(parameters, "token", selected_languages=("fr",), dry_run=True)
+        assert not summary.pushed
+        assert not summary.created
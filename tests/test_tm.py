@@ -0,0 +1,153 @@
+import shutil
+
+from contextlib import chdir
+from pathlib import Path
+
+import pytest
+
+from click.testing import CliRunner
+
+from qt_transifex.errors import TranslationError
+from qt_transifex.main import cli
+from qt_transifex.tm import (
+    TranslationMemory,
+    normalize,
+    read_units,
+)
+
+TS_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1"{lang}>
+<context>
+    <name>{context}</name>
+{messages}
+</context>
+</TS>
+"""
+
+
+def write_ts(path: Path, lang: str | None, context: str, messages: list[tuple[str, str | None]]) -> Path:
+    def message(source: str, translation: str | None) -> str:
+        if translation is None:
+            tr = '<translation type="unfinished"></translation>'
+        else:
+            tr = f"<translation>{translation}</translation>"
+        return f"    <message>\n        <source>{source}</source>\n        {tr}\n    </message>"
+
+    path.write_text(
+        TS_TEMPLATE.format(
+            lang=f' language="{lang}"' if lang else "",
+            context=context,
+            messages="\n".join(message(s, t) for s, t in messages),
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_normalize():
+    assert normalize("&Cancel") == "cancel"
+    assert normalize("  Save\n  &As ") == "save as"
+    assert normalize("Fish && Chips") == "fish & chips"
+
+
+def test_tm_index_and_fill(tmp_path: Path):
+    src = write_ts(
+        tmp_path.joinpath("plugin_a_fr.ts"),
+        "fr",
+        "Dialog",
+        [("Cancel", "Annuler"), ("Layer", "Couche"), ("Pending", None)],
+    )
+    units = list(read_units(src))
+    assert len(units) == 2
+
+    with TranslationMemory(tmp_path.joinpath("tm.sqlite")) as mem:
+        assert mem.index([src]) == 1
+        # Unchanged file is skipped
+        assert mem.index([src]) == 0
+        assert mem.index([src], force=True) == 1
+
+        assert mem.lookup("fr", "Other", "Cancel") == "Annuler"
+        assert mem.lookup("de", "Dialog", "Cancel") is None
+
+        dst = write_ts(
+            tmp_path.joinpath("plugin_b_fr.ts"),
+            "fr",
+            "Widget",
+            [("Cancel", None), ("&amp;Layer", None), ("Unknown", None)],
+        )
+        rv = mem.fill(dst)
+        assert (rv.exact, rv.normalized, rv.missing) == (1, 1, 1)
+
+    filled = {u.source: u.translation for u in read_units(dst)}
+    # Normalized matches are left unfinished
+    assert filled == {"Cancel": "Annuler"}
+    assert "Couche" in dst.read_text()
+
+
+def test_tm_language_from_file_name(tmp_path: Path):
+    # pylupdate5 does not set the language attribute
+    src = write_ts(tmp_path.joinpath("plugin_a_pt_BR.ts"), None, "Dialog", [("Cancel", "Cancelar")])
+    assert {u.lang for u in read_units(src)} == {"pt_BR"}
+    assert {u.lang for u in read_units(src, "plugin_a")} == {"pt_BR"}
+
+    with TranslationMemory(tmp_path.joinpath("tm.sqlite")) as mem:
+        mem.index([src])
+        dst = write_ts(tmp_path.joinpath("plugin_b_pt_BR.ts"), None, "Dialog", [("Cancel", None)])
+        rv = mem.fill(dst, "plugin_b")
+        assert rv.exact == 1
+
+
+def test_tm_index_errors_and_prune(tmp_path: Path):
+    good = write_ts(tmp_path.joinpath("plugin_fr.ts"), "fr", "Dialog", [("Layer", "Couche")])
+    bad = tmp_path.joinpath("broken_fr.ts")
+    bad.write_text("<TS>")
+
+    with TranslationMemory(tmp_path.joinpath("tm.sqlite")) as mem:
+        # Invalid files do not prevent indexing the others
+        assert mem.index([good, bad]) == 1
+        assert mem.lookup("fr", "Dialog", "Layer") == "Couche"
+
+        good.unlink()
+        mem.index([])
+        assert mem.lookup("fr", "Dialog", "Layer") is None
+
+
+def test_tm_fill_errors(tmp_path: Path):
+    bad = tmp_path.joinpath("plugin_de.ts")
+    bad.write_text("<TS><context>")
+
+    with TranslationMemory(tmp_path.joinpath("tm.sqlite")) as mem, pytest.raises(TranslationError):
+        mem.fill(bad)
+
+
+def test_cli_tm_fill_errors(fixtures: Path, tmp_path: Path):
+    rootdir = shutil.copytree(fixtures, tmp_path.joinpath("fixtures"))
+    i18n_path = rootdir.joinpath("qt_transifex_testing", "i18n")
+    i18n_path.mkdir(exist_ok=True)
+
+    src = write_ts(tmp_path.joinpath("other_fr.ts"), "fr", "Dialog", [("Layer", "Couche")])
+    i18n_path.joinpath("qt_transifex_testing_de.ts").write_text("<TS><context>")
+    dst = write_ts(i18n_path.joinpath("qt_transifex_testing_fr.ts"), "fr", "Dialog", [("Layer", None)])
+
+    db_path = str(tmp_path.joinpath("tm.sqlite"))
+    with chdir(rootdir):
+        runner = CliRunner()
+        result = runner.invoke(cli, ["tm", "--db", db_path, "index", str(src)])
+        assert result.exit_code == 0
+        result = runner.invoke(cli, ["tm", "--db", db_path, "fill"])
+        assert result.exit_code == 0
+
+    # Invalid files do not prevent filling the others
+    assert {u.source: u.translation for u in read_units(dst)} == {"Layer": "Couche"}
+
+
+def test_tm_fill_encoding(tmp_path: Path):
+    src = write_ts(tmp_path.joinpath("plugin_a_ru.ts"), "ru", "Dialog", [("Layer", "Слой")])
+    dst = write_ts(tmp_path.joinpath("plugin_b_ru.ts"), "ru", "Dialog", [("Layer", None)])
+
+    with TranslationMemory(tmp_path.joinpath("tm.sqlite")) as mem:
+        mem.index([src])
+        mem.fill(dst)
+
+    assert "Слой" in dst.read_text(encoding="utf-8")